@@ -1,40 +1,43 @@
 #!/usr/bin/env python3
 """Advanced example showing more SDK features"""
 
+import asyncio
 import os
 
 from dotenv import load_dotenv
 
-from superme_sdk import SuperMeClient
+from superme_sdk import AsyncSuperMeClient, get_default_client
 
 load_dotenv()
 
 
 def main():
     api_key = os.environ["SUPERME_API_KEY"]
-    client = SuperMeClient(api_key=api_key)
+    client = get_default_client(api_key=api_key)
 
     print("SuperMe SDK Advanced Example")
     print("=" * 50)
 
-    # 1. Multi-turn conversation with OpenAI interface
+    # 1. Multi-turn conversation with OpenAI interface. Only the last user
+    #    message is forwarded, so there is no need to grow a local history:
+    #    send the new turn and let conversation_id carry the thread.
     print("\n1. Multi-turn conversation (OpenAI-style):")
-    messages = [{"role": "user", "content": "What is content marketing?"}]
-
     r1 = client.chat.completions.create(
-        model="gpt-4", messages=messages, username="ludo"
+        model="gpt-4",
+        messages=[{"role": "user", "content": "What is content marketing?"}],
+        username="ludo",
     )
     conv_id = r1.metadata["conversation_id"]
     print(f"Turn 1: {r1.choices[0].message.content[:150]}...")
 
-    messages.append({"role": "assistant", "content": r1.choices[0].message.content})
-    messages.append(
-        {"role": "user", "content": "How does it differ from social media marketing?"}
-    )
-
     r2 = client.chat.completions.create(
         model="gpt-4",
-        messages=messages,
+        messages=[
+            {
+                "role": "user",
+                "content": "How does it differ from social media marketing?",
+            }
+        ],
         username="ludo",
         conversation_id=conv_id,
     )
@@ -42,22 +45,43 @@ def main():
 
     # 2. MCP tools - list available tools
     print("\n2. List MCP tools:")
-    tools = client.mcp_list_tools()
+    tools = client.low_level.list_tools()
     for tool in tools:
         print(f"  - {tool['name']}: {tool.get('description', '')[:60]}")
 
     # 3. MCP tool call - find users by name
     print("\n3. Find profiles by name:")
-    result = client.mcp_tool_call("find_profiles", {"identifier": "ludo"})
+    result = client.low_level.tool_call("find_profiles", {"identifier": "ludo"})
     print(f"  Result: {str(result)[:200]}")
 
-    # 4. List conversations
+    # 4. List conversations and show the most recent one. The tool result
+    #    arrives as JSON text inside the JSON-RPC envelope, so it is decoded
+    #    in full either way. List tools usually wrap the list in a dict
+    #    ({"conversations": [...]}) and an empty result decodes to {}.
     print("\n4. List conversations:")
-    conversations = client.mcp_tool_call("list_conversations", {"username": "ludo"})
-    print(f"  Conversations: {conversations[:200]}")
+    result = client.low_level.tool_call("list_conversations", {"username": "ludo"})
+    items = result.get("conversations", []) if isinstance(result, dict) else result
+    first = items[0] if items else None
+    print(f"  {len(items)} conversations; first: {str(first)[:200]}")
+
+    # 5. Ask several agents concurrently (async)
+    print("\n5. Same question to several agents, concurrently:")
+    usernames = ["ludo", "casey"]
+    answers = asyncio.run(ask_concurrently(api_key, "What is PMF?", usernames))
+    for username, answer in zip(usernames, answers):
+        print(f"  {username}: {answer[:100]}...")
 
     print("\nAdvanced example completed!")
 
 
+async def ask_concurrently(api_key, question, usernames):
+    """Fan independent questions out with asyncio.gather — total wall time is
+    roughly the slowest single answer rather than the sum of all of them."""
+    async with AsyncSuperMeClient(api_key=api_key) as client:
+        return await asyncio.gather(
+            *[client.ask(question, username=u) for u in usernames]
+        )
+
+
 if __name__ == "__main__":
     main()
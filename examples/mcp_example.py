@@ -5,41 +5,41 @@ import os
 
 from dotenv import load_dotenv
 
-from superme_sdk import SuperMeClient
+from superme_sdk import get_default_client
 
 load_dotenv()
 
 
 def main():
     api_key = os.environ["SUPERME_API_KEY"]
-    client = SuperMeClient(api_key=api_key)
+    client = get_default_client(api_key=api_key)
 
     print("SuperMe SDK MCP Example")
     print("=" * 50)
 
     # 1. List all available MCP tools
     print("\n1. Available MCP tools:")
-    tools = client.mcp_list_tools()
+    tools = client.low_level.list_tools()
     for tool in tools:
         print(f"  - {tool['name']}: {tool.get('description', '')[:80]}")
 
     # 2. Call the ask tool directly
     print("\n2. Ask via MCP tool call:")
-    answer = client.mcp_tool_call(
+    answer = client.low_level.tool_call(
         "ask",
-        {"question": "What is growth marketing?", "username": "ludo"},
+        {"question": "What is growth marketing?", "identifier": "ludo"},
     )
     print(f"  Answer: {str(answer)[:200]}")
 
     # 3. Raw JSON-RPC request (tools/list)
     print("\n3. Raw JSON-RPC request (tools/list):")
-    raw = client.raw_request("tools/list", {})
+    raw = client.low_level.raw_request("tools/list")
     tool_names = [t["name"] for t in raw.get("tools", [])]
     print(f"  Tools: {tool_names}")
 
     # 4. Raw JSON-RPC request (tools/call)
     print("\n4. Raw JSON-RPC request (tools/call):")
-    raw2 = client.raw_request(
+    raw2 = client.low_level.raw_request(
         "tools/call",
         {"name": "find_profiles", "arguments": {"identifier": "ludo"}},
     )
@@ -5,24 +5,29 @@ import os
 
 from dotenv import load_dotenv
 
-from superme_sdk import SuperMeClient
+from superme_sdk import get_default_client
 
 load_dotenv()
 
 
 def main():
     api_key = os.environ["SUPERME_API_KEY"]
-    client = SuperMeClient(api_key=api_key)
+    client = get_default_client(api_key=api_key)
 
     print("SuperMe SDK Simple Example")
     print("=" * 50)
 
-    # 1. Simple question
-    print("\n1. Simple question:")
-    answer = client.ask(
-        "What are the key principles of growth marketing?", username="ludo"
-    )
-    print(f"Answer: {answer[:200]}...")
+    # 1. Simple question, streamed — text prints as soon as it is generated
+    print("\n1. Simple question (streaming):")
+    print("Answer: ", end="")
+    for chunk in client.ask(
+        "What are the key principles of growth marketing?",
+        username="ludo",
+        stream=True,
+    ):
+        if chunk["type"] == "content":
+            print(chunk["text"], end="", flush=True)
+    print()
 
     # 2. Anonymous question (incognito mode)
     print("\n2. Anonymous question (incognito mode):")
@@ -43,18 +48,16 @@ def main():
     print(f"Response: {response.choices[0].message.content[:200]}...")
     print(f"Conversation ID: {response.metadata['conversation_id']}")
 
-    # 4. Multi-turn conversation
+    # 4. Multi-turn conversation — only the new question is sent each turn;
+    #    the server keeps the history under the conversation ID.
     print("\n4. Multi-turn conversation:")
-    messages = [{"role": "user", "content": "What is growth hacking?"}]
-
-    response1, conv_id = client.ask_with_history(messages, username="ludo")
+    response1 = client.ask("What is growth hacking?", username="ludo")
     print(f"First response: {response1[:150]}...")
 
-    messages.append({"role": "assistant", "content": response1})
-    messages.append({"role": "user", "content": "Give me 3 examples"})
-
-    response2, conv_id = client.ask_with_history(
-        messages, username="ludo", conversation_id=conv_id
+    response2 = client.ask(
+        "Give me 3 examples",
+        username="ludo",
+        conversation_id=client.last_conversation_id,
     )
     print(f"Second response: {response2[:150]}...")
 
@@ -1,7 +1,8 @@
 """SuperMe SDK - Python client for SuperMe AI API"""
 
 from .client import AsyncSuperMeClient, SuperMeClient
-from .auth import load_token, save_token, remove_token, resolve_token
+from ._default import get_default_client
+from .auth import load_token, save_token, remove_token, resolve_token, token_expired
 from .exceptions import (
     SuperMeError,
     AuthError,
@@ -26,16 +27,20 @@ from .streaming import (
     ToolChunk,
     DoneChunk,
     ErrorChunk,
+    stream_to_string,
+    astream_to_string,
 )
 
 __version__ = "0.9.0"
 __all__ = [
     "SuperMeClient",
     "AsyncSuperMeClient",
+    "get_default_client",
     "load_token",
     "save_token",
     "remove_token",
     "resolve_token",
+    "token_expired",
     "SuperMeError",
     "AuthError",
     "RateLimitError",
@@ -55,4 +60,6 @@ __all__ = [
     "ToolChunk",
     "DoneChunk",
     "ErrorChunk",
+    "stream_to_string",
+    "astream_to_string",
 ]
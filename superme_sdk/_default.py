@@ -0,0 +1,61 @@
+"""Process-wide shared :class:`~superme_sdk.SuperMeClient`."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+from .auth import resolve_token
+from .client import SuperMeClient
+
+# (constructor kwargs, client) — a single tuple so readers never see a
+# client paired with another client's kwargs
+_default: Optional[tuple[dict[str, Any], SuperMeClient]] = None
+_lock = threading.Lock()
+
+
+def get_default_client(**kwargs: Any) -> SuperMeClient:
+    """Return the process-global client, creating it on first use.
+
+    Reusing one client shares its connection pools, answer cache and
+    lazily built HTTP clients across every caller in the process (scripts,
+    notebooks, test helpers). Thread-safe: concurrent first calls build a
+    single client.
+
+    Example:
+        ```python
+        import superme_sdk
+
+        client = superme_sdk.get_default_client()  # token from env / ~/.superme/token
+        answer = client.ask("What is PMF?", username="ludo")
+        ```
+
+    Args:
+        **kwargs: :class:`~superme_sdk.SuperMeClient` constructor arguments.
+            ``api_key`` defaults to :func:`~superme_sdk.resolve_token`.
+            Calling again with different arguments (or after the shared
+            client was closed) builds and caches a new client; a replaced
+            client is left open for any code still holding it.
+
+    Returns:
+        The shared :class:`~superme_sdk.SuperMeClient`.
+
+    Raises:
+        ValueError: If no API key is given and none can be resolved.
+    """
+    global _default
+    kwargs["api_key"] = resolve_token(kwargs.get("api_key"))
+    current = _default
+    if _reusable(current, kwargs):
+        return current[1]
+    with _lock:
+        if not _reusable(_default, kwargs):
+            _default = (kwargs, SuperMeClient(**kwargs))
+        return _default[1]
+
+
+def _reusable(
+    entry: Optional[tuple[dict[str, Any], SuperMeClient]], kwargs: dict[str, Any]
+) -> bool:
+    # a client closed by its user (e.g. ``with get_default_client():``) is replaced
+    return entry is not None and entry[0] == kwargs and not entry[1]._http.is_closed
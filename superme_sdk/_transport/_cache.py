@@ -0,0 +1,66 @@
+"""In-process LRU cache for non-streaming ``ask`` answers.
+
+Shared by the sync and async conversation mixins so the two never drift.
+Enabled per client with ``cache_enabled=True``; a hit skips the MCP/partner
+round-trip (and the agent's generation time) entirely.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+MISS = object()
+"""Sentinel returned by :meth:`AnswerCache.get` when a key is not cached."""
+
+
+def cache_key(*parts: Any, **kwargs: Any) -> Hashable | None:
+    """Build a cache key from call arguments.
+
+    Returns None when any argument is unhashable (e.g. an ``extra_body``
+    dict) — such calls are simply not cached.
+    """
+    key = (parts, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class AnswerCache:
+    """Thread-safe LRU mapping of call keys to answers.
+
+    Least recently used entries are evicted once ``maxsize`` is exceeded.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 1:
+            raise ValueError("cache_size must be >= 1")
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for ``key``, or :data:`MISS`."""
+        with self._lock:
+            if key not in self._data:
+                return MISS
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
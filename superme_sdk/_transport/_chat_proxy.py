@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import time
 import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Optional
 
 from ..models import ChatCompletion
@@ -11,6 +13,27 @@ from ..models import ChatCompletion
 if TYPE_CHECKING:
     from ..client import SuperMeClient
 
+# Shared ``extra_body`` default: read-only, so one instance serves every call.
+_NO_EXTRA_BODY: Mapping[str, Any] = MappingProxyType({})
+
+
+def ask_arguments(
+    question: str,
+    username: str,
+    conversation_id: Optional[str] = None,
+    incognito: bool = False,
+) -> dict[str, Any]:
+    """Build the MCP ``ask`` tool arguments."""
+    args: dict[str, Any] = {
+        "identifier": username,
+        "question": question,
+    }
+    if conversation_id:
+        args["conversation_id"] = conversation_id
+    if incognito:
+        args["incognito"] = True
+    return args
+
 
 class Completions:
     """Proxy for ``client.chat.completions``."""
@@ -50,9 +73,15 @@ class Completions:
             - ``model`` — ignored. The SuperMe AI determines the model.
             - ``messages`` — only the last ``role: user`` message is sent.
               Prior messages in the list are **not** forwarded; pass
-              ``conversation_id`` to continue a thread.
+              ``conversation_id`` to continue a thread (the server keeps the
+              history, so each turn costs the same regardless of its length).
+              The latest ID is also kept on ``client.last_conversation_id``.
             - ``max_tokens`` — ignored by the MCP backend.
             - ``response_format`` — not supported, ignored.
+            - ``extra_body`` — its ``username``, ``incognito`` and
+              ``conversation_id`` keys override the keyword arguments. It is
+              only read, never mutated, so a single template dict can be
+              reused across calls.
 
         Args:
             messages: List of ``{"role": ..., "content": ...}`` dicts.
@@ -72,7 +101,7 @@ class Completions:
         # to pass routing params through the OpenAI-compatible interface.
         # Extract any recognised fields from extra_body and let them override
         # the direct kwargs so old call sites keep working without changes.
-        extra_body: dict = kwargs.pop("extra_body", {}) or {}
+        extra_body: Mapping[str, Any] = kwargs.pop("extra_body", None) or _NO_EXTRA_BODY
         if "username" in extra_body:
             username = extra_body["username"]
         if "incognito" in extra_body:
@@ -90,16 +119,10 @@ class Completions:
         if not question:
             raise ValueError("messages must contain at least one user message")
 
-        args: dict[str, Any] = {
-            "identifier": username,
-            "question": question,
-        }
-        if conversation_id:
-            args["conversation_id"] = conversation_id
-        if incognito:
-            args["incognito"] = True
-
+        args = ask_arguments(question, username, conversation_id, incognito)
         result = self._client._mcp_tool_call("ask", args)
+        if result.get("conversation_id"):
+            self._client._last_conversation_id = result["conversation_id"]
 
         # Build an OpenAI-shaped ChatCompletion from the MCP result
         return ChatCompletion(
@@ -10,6 +10,7 @@ from typing import Any
 import httpx
 
 from ..exceptions import APIError, AuthError, MCPError, NotFoundError, RateLimitError
+from ._json import json_dumps, json_loads
 from ._sse import iter_sse_lines
 
 # Streaming: bound connect/write/pool but leave read unbounded (turns can be slow).
@@ -33,8 +34,8 @@ def _decode_jwt(token: str) -> dict[str, Any]:
 def _loads_or_none(line: str) -> dict | None:
     """Parse an SSE data line as a JSON object, or None if not a JSON dict."""
     try:
-        obj = json.loads(line)
-    except (json.JSONDecodeError, ValueError):
+        obj = json_loads(line)
+    except ValueError:
         return None
     return obj if isinstance(obj, dict) else None
 
@@ -43,19 +44,49 @@ class HttpMixin:
     """Private HTTP, JSON-RPC, and SSE plumbing shared by all domain mixins.
 
     Expects the following attributes set by ``SuperMeClient.__init__``:
-        self._http, self._rest_http, self._rpc_id, self.api_key, self.base_url
+        self._http, self._rest_http, self._rpc_id, self.api_key, self.base_url,
+        self._auth_headers (built once; every HTTP client copies it),
+        self._lazy_clients, self._lazy_lock (an RLock), self._closed
+        (see :meth:`_lazy_http` and :meth:`_ensure_open`)
     """
 
+    def _lazy_http(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return the HTTP client ``name``, building it on first use.
+
+        Thread-safe: concurrent first uses build one client. ``build`` goes
+        through the client's ``_make_http`` factory, which refuses to open
+        new pools once the client is closed (see :meth:`_ensure_open`).
+        """
+        http = self._lazy_clients.get(name)
+        if http is None:
+            with self._lazy_lock:
+                http = self._lazy_clients.get(name)
+                if http is None:
+                    http = self._lazy_clients[name] = build()
+        return http
+
+    def _ensure_open(self) -> None:
+        """Raise httpx's "client has been closed" error once closed.
+
+        Call with ``self._lazy_lock`` held, so a pool is never opened after
+        ``close()`` has started — nothing would ever close it.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot send a request, as the client has been closed.")
+
     def _next_rpc_id(self) -> int:
         self._rpc_id += 1
         return self._rpc_id
 
-    def _mcp_request(self, method: str, params: dict) -> dict:
+    def _mcp_request(
+        self, method: str, params: dict, *, http: httpx.Client | None = None
+    ) -> dict:
         """Send a JSON-RPC 2.0 request to /mcp on the REST base URL.
 
         FastMCP Streamable HTTP may respond with either
         ``application/json`` or ``text/event-stream`` (SSE).  This method
-        handles both transparently.
+        handles both transparently.  ``http`` overrides the client used
+        (batch helpers pass a batch-scoped one).
         """
         payload = {
             "jsonrpc": "2.0",
@@ -63,14 +94,14 @@ class HttpMixin:
             "method": method,
             "params": params,
         }
-        resp = self._http.post("/mcp/", json=payload)
+        resp = (http or self._http).post("/mcp/", content=json_dumps(payload))
         self._check_rest_response(resp)
 
         ct = resp.headers.get("content-type", "")
         if "text/event-stream" in ct:
             body = self._parse_sse_json(resp.text)
         else:
-            body = resp.json()
+            body = json_loads(resp.content)
 
         if "error" in body:
             err = body["error"]
@@ -80,13 +111,35 @@ class HttpMixin:
             )
         return body.get("result", {})
 
+    def raw_request(self, method: str, params: dict | None = None) -> dict:
+        """Send a raw MCP JSON-RPC request and return its ``result``.
+
+        Goes through the client's pooled ``/mcp`` connection, so repeated
+        calls reuse the same keep-alive connection and auth headers.
+
+        Example:
+            ```python
+            result = client.raw_request("tools/list")
+            print([t["name"] for t in result.get("tools", [])])
+            ```
+
+        Args:
+            method: JSON-RPC method name (e.g. ``"tools/list"``).
+            params: JSON-RPC params. Defaults to ``{}``.
+
+        Returns:
+            The JSON-RPC ``result`` dict.
+        """
+        return self._mcp_request(method, params or {})
+
     def _mcp_tool_call(
-        self, tool_name: str, arguments: dict
+        self, tool_name: str, arguments: dict, *, http: httpx.Client | None = None
     ) -> dict[str, Any] | list[Any]:
         """Call an MCP tool and return the parsed JSON content (dict or list)."""
         result = self._mcp_request(
             "tools/call",
             {"name": tool_name, "arguments": arguments},
+            http=http,
         )
         # MCP tools return {content: [{type: "text", text: "<json>"}]}
         content_list = result.get("content", [])
@@ -94,7 +147,7 @@ class HttpMixin:
             return {}
         raw_text = content_list[0].get("text")
         text = (raw_text or "").strip() or "{}"
-        return json.loads(text)
+        return json_loads(text)
 
     def _iter_sse(
         self,
@@ -139,7 +192,7 @@ class HttpMixin:
         if not contents:
             return {}
         text = (contents[0].get("text") or "").strip() or "{}"
-        return json.loads(text)
+        return json_loads(text)
 
     @staticmethod
     def _parse_sse_json(text: str) -> dict:
@@ -171,7 +224,7 @@ class HttpMixin:
             last_block = current_block
         if not last_block:
             raise ValueError("No data lines found in SSE response")
-        return json.loads("".join(last_block).rstrip("\n"))
+        return json_loads("".join(last_block).rstrip("\n"))
 
     @staticmethod
     def _check_rest_response(resp: "httpx.Response") -> None:
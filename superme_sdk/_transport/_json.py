@@ -0,0 +1,54 @@
+"""JSON encode/decode for the MCP transport.
+
+Uses ``orjson`` when it is installed (``pip install superme-sdk[speedups]``)
+and falls back to the standard library otherwise. Both paths accept ``str``
+or ``bytes`` and raise a :class:`ValueError` subclass on malformed input.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _std_dumps(obj: Any) -> bytes:
+    # allow_nan=False: NaN/Infinity are not JSON — raise ValueError, as
+    # httpx's ``json=`` did, rather than send an invalid body
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    ).encode()
+
+
+if orjson is not None:
+
+    def json_loads(data: str | bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259; the stdlib also accepts the
+            # NaN/Infinity tokens Python servers may emit.
+            return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        try:
+            data = orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # non-str keys, ints beyond 64 bits, ... — the stdlib copes, and
+            # installing the extra must not change which arguments work
+            return _std_dumps(obj)
+        # orjson silently writes NaN/Infinity as null; re-encode anything
+        # containing a null with the stdlib so those raise ValueError instead
+        return _std_dumps(obj) if b"null" in data else data
+
+else:
+
+    def json_loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        return _std_dumps(obj)
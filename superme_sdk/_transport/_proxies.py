@@ -0,0 +1,57 @@
+"""Environment proxy mounts for clients built with a custom transport.
+
+httpx only honours ``HTTP_PROXY`` / ``HTTPS_PROXY`` / ``ALL_PROXY`` /
+``NO_PROXY`` when it builds its own transport. The SDK passes one (to retry
+failed connects), so it rebuilds the same mounts here, following httpx's
+own rules. Proxy transports share the client's settings, though httpcore
+does not retry connects to the proxy itself.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+from collections.abc import Callable
+from typing import Optional, TypeVar
+from urllib.request import getproxies
+
+import httpx
+
+T = TypeVar("T")
+
+
+def env_proxy_mounts(
+    make_transport: Callable[[httpx.Proxy], T],
+) -> dict[str, Optional[T]]:
+    """Return httpx ``mounts`` for the proxies configured in the environment.
+
+    ``make_transport`` builds the transport for one proxy. ``NO_PROXY`` hosts
+    map to None, which httpx resolves to the client's default transport.
+    """
+    proxies = getproxies()
+    mounts: dict[str, Optional[T]] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            if "://" not in url:
+                url = f"http://{url}"
+            mounts[f"{scheme}://"] = make_transport(httpx.Proxy(url))
+    for host in (h.strip() for h in proxies.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if host:
+            mounts[_no_proxy_pattern(host)] = None
+    return mounts
+
+
+def _no_proxy_pattern(host: str) -> str:
+    # Same mapping as httpx: ``example.com`` bypasses the domain and its
+    # subdomains, addresses and ``localhost`` match exactly.
+    if "://" in host:
+        return host
+    if host.lower() == "localhost":
+        return f"all://{host}"
+    try:
+        address = ipaddress.ip_address(host.split("/")[0])
+    except ValueError:
+        return f"all://*{host}"
+    return f"all://[{host}]" if address.version == 6 else f"all://{host}"
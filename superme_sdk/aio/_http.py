@@ -10,13 +10,13 @@ Expects the following attributes set by ``AsyncSuperMeClient.__init__``:
 
 from __future__ import annotations
 
-import json
 from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 import httpx
 
 from .._transport._http import _STREAM_TIMEOUT, _loads_or_none
+from .._transport._json import json_dumps, json_loads
 from .._transport._sse import aiter_sse_lines
 from ..exceptions import MCPError
 
@@ -37,14 +37,14 @@ class AsyncHttpMixin:
             "method": method,
             "params": params,
         }
-        resp = await self._async_http.post("/mcp/", json=payload)
+        resp = await self._async_http.post("/mcp/", content=json_dumps(payload))
         self._check_rest_response(resp)
 
         ct = resp.headers.get("content-type", "")
         if "text/event-stream" in ct:
             body = self._parse_sse_json(resp.text)
         else:
-            body = resp.json()
+            body = json_loads(resp.content)
 
         if "error" in body:
             err = body["error"]
@@ -54,6 +54,10 @@ class AsyncHttpMixin:
             )
         return body.get("result", {})
 
+    async def raw_request(self, method: str, params: dict | None = None) -> dict:
+        """Async twin of :meth:`HttpMixin.raw_request`."""
+        return await self._async_mcp_request(method, params or {})
+
     async def _async_mcp_tool_call(
         self, tool_name: str, arguments: dict
     ) -> "dict[str, Any] | list[Any]":
@@ -67,7 +71,7 @@ class AsyncHttpMixin:
             return {}
         raw_text = content_list[0].get("text")
         text = (raw_text or "").strip() or "{}"
-        return json.loads(text)
+        return json_loads(text)
 
     async def _async_mcp_read_resource(self, uri: str) -> "dict[str, Any] | list[Any]":
         """Read an MCP resource by URI asynchronously and return its JSON contents."""
@@ -76,7 +80,7 @@ class AsyncHttpMixin:
         if not contents:
             return {}
         text = (contents[0].get("text") or "").strip() or "{}"
-        return json.loads(text)
+        return json_loads(text)
 
     async def _aiter_sse(
         self,
@@ -6,8 +6,12 @@ Reads/writes API tokens from ~/.superme/token (same location used by mcp-install
 from __future__ import annotations
 
 import os
+import tempfile
+import time
 from pathlib import Path
 
+from ._transport._http import _decode_jwt
+
 # Default token file location (shared with mcp-install.sh)
 DEFAULT_CONFIG_DIR = Path.home() / ".superme"
 DEFAULT_TOKEN_FILE = DEFAULT_CONFIG_DIR / "token"
@@ -41,9 +45,16 @@ def save_token(token: str, token_file: Path | str | None = None) -> Path:
     """
     path = Path(token_file) if token_file else DEFAULT_TOKEN_FILE
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(token.strip() + "\n")
-    # chmod 600
-    path.chmod(0o600)
+    # Write to a 0600 temp file and rename over the target, so the token is
+    # never briefly world-readable and readers never see a partial file.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".token-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(token.strip() + "\n")
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
     return path
 
 
@@ -63,6 +74,22 @@ def remove_token(token_file: Path | str | None = None) -> bool:
     return False
 
 
+def token_expired(token: str, leeway: float = 0.0) -> bool:
+    """Return True if ``token`` is a JWT whose ``exp`` claim has passed.
+
+    Tokens without a readable ``exp`` (opaque API keys, malformed JWTs) are
+    never considered expired — only the server can reject those.
+
+    Args:
+        token: The API token.
+        leeway: Treat the token as expired this many seconds early.
+    """
+    exp = _decode_jwt(token).get("exp")
+    if not isinstance(exp, (int, float)):
+        return False
+    return exp - leeway <= time.time()
+
+
 def resolve_token(
     api_key: str | None = None,
     env_var: str = "SUPERME_API_KEY",
@@ -72,7 +99,8 @@ def resolve_token(
 
     1. Explicit api_key argument
     2. Environment variable (SUPERME_API_KEY)
-    3. Token file (~/.superme/token)
+    3. Token file (~/.superme/token), unless it holds an expired JWT — that
+       would only earn a 401, so it is skipped rather than sent.
 
     Args:
         api_key: Explicitly provided API key.
@@ -87,4 +115,7 @@ def resolve_token(
     env_token = os.environ.get(env_var)
     if env_token:
         return env_token
-    return load_token(token_file)
+    file_token = load_token(token_file)
+    if file_token and token_expired(file_token):
+        return None
+    return file_token
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Any, Optional
 
 import httpx
 
+from ._transport._cache import AnswerCache
 from ._transport._chat_proxy import Chat, Completions
+from ._transport._proxies import env_proxy_mounts
+from ._transport._singleflight import AsyncSingleFlight, SingleFlight
 from ._transport._http import HttpMixin, _decode_jwt
 from .aio._http import AsyncHttpMixin
 from .services._agentic_resume import AgenticResumeMixin
@@ -77,6 +81,15 @@ class LowLevel:
         data = self._client._mcp_request("tools/list", {})
         return data.get("tools", [])
 
+    def raw_request(self, method: str, params: Optional[dict] = None) -> dict:
+        """Send a raw MCP JSON-RPC request and return its ``result`` dict.
+
+        Args:
+            method: JSON-RPC method name (e.g. ``"tools/list"``).
+            params: JSON-RPC params. Defaults to ``{}``.
+        """
+        return self._client.raw_request(method, params)
+
 
 class SuperMeClient(
     AgenticResumeMixin,
@@ -110,6 +123,14 @@ class SuperMeClient(
 
         # Low-level MCP access
         tools = client.low_level.list_tools()
+
+    Pass ``http2=True`` (requires ``pip install superme-sdk[http2]``) to
+    multiplex concurrent requests over a single connection per host, and
+    ``cache_enabled=True`` to answer repeated identical non-streaming
+    ``ask`` calls from an in-process LRU of ``cache_size`` entries
+    (see :meth:`clear_cache`); identical calls made concurrently from
+    several threads then also share one in-flight request. Failed
+    connection attempts are retried ``max_retries`` times.
     """
 
     def __init__(
@@ -119,6 +140,10 @@ class SuperMeClient(
         rest_base_url: str = "https://www.superme.ai",
         partner_base_url: str = "https://api.superme.ai",
         timeout: float = 120.0,
+        http2: bool = False,
+        max_retries: int = 2,
+        cache_enabled: bool = False,
+        cache_size: int = 256,
     ):
         if not api_key:
             raise ValueError("api_key is required")
@@ -126,28 +151,23 @@ class SuperMeClient(
         self.base_url = base_url.rstrip("/")
         self.rest_base_url = rest_base_url.rstrip("/")
         self.partner_base_url = partner_base_url.rstrip("/")
-        _auth_headers = {
+        self._auth_headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json, text/event-stream",
         }
-        self._http = httpx.Client(
-            base_url=self.base_url,
-            headers=_auth_headers,
-            timeout=timeout,
-            follow_redirects=True,
-        )
-        self._rest_http = httpx.Client(
-            base_url=self.rest_base_url,
-            headers=dict(_auth_headers),
-            timeout=timeout,
-        )
-        self._partner_http = httpx.Client(
-            base_url=self.partner_base_url,
-            headers=dict(_auth_headers),
-            timeout=timeout,
-        )
+        self._timeout = timeout
+        self._http2 = http2
+        self._max_retries = max_retries
+        # reentrant: _lazy_http holds it while _make_http takes it again
+        self._lazy_lock = threading.RLock()
+        self._closed = False
+        self._lazy_clients: dict[str, httpx.Client] = {}
+        self._http = self._make_http(self.base_url, follow_redirects=True)
         self._rpc_id = 0
+        self._answer_cache = AnswerCache(cache_size) if cache_enabled else None
+        self._last_conversation_id: Optional[str] = None
+        self._inflight = SingleFlight()
         self.chat = Chat(self)
         self.low_level = LowLevel(self)
 
@@ -165,14 +185,71 @@ class SuperMeClient(
         """Extract user_id from the JWT token payload."""
         return _decode_jwt(self.api_key).get("user_id")
 
+    @property
+    def last_conversation_id(self) -> Optional[str]:
+        """Conversation ID returned by the most recent ``ask`` on this client.
+
+        Pass it as ``conversation_id`` to continue that thread. Only the new
+        question is sent each turn — the server holds the history.
+        """
+        return self._last_conversation_id
+
+    # ------------------------------------------------------------------
+    # HTTP clients. REST / partner ones are built on first use — MCP-only
+    # callers never pay for their connection pools and SSL contexts.
+    # ------------------------------------------------------------------
+
+    def _make_http(self, base_url: str, **kwargs: Any) -> httpx.Client:
+        """Build an HTTP client with this client's auth, timeout and transport.
+
+        The transport retries failed *connection attempts* up to
+        ``max_retries`` times (safe for any method — nothing reached the
+        server). Error responses are never retried: re-sending an ``ask``
+        after a 5xx could duplicate a conversation turn. Environment proxies
+        are mounted explicitly, since httpx ignores them once a transport is
+        passed in. Raises ``RuntimeError`` once the client is closed.
+        """
+
+        def _transport(proxy: Optional[httpx.Proxy] = None) -> httpx.HTTPTransport:
+            return httpx.HTTPTransport(
+                http2=self._http2, retries=self._max_retries, proxy=proxy
+            )
+
+        with self._lazy_lock:
+            self._ensure_open()
+            return httpx.Client(
+                base_url=base_url,
+                headers=dict(self._auth_headers),
+                timeout=self._timeout,
+                transport=_transport(),
+                mounts=env_proxy_mounts(_transport),
+                **kwargs,
+            )
+
+    @property
+    def _rest_http(self) -> httpx.Client:
+        return self._lazy_http("rest", lambda: self._make_http(self.rest_base_url))
+
+    @property
+    def _partner_http(self) -> httpx.Client:
+        return self._lazy_http(
+            "partner", lambda: self._make_http(self.partner_base_url)
+        )
+
     # ------------------------------------------------------------------
     # Context manager / cleanup
     # ------------------------------------------------------------------
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
-        self._partner_http.close()
-        self._rest_http.close()
+        """Close the underlying HTTP clients.
+
+        The client cannot be used afterwards: requests raise httpx's
+        "client has been closed" ``RuntimeError``.
+        """
+        with self._lazy_lock:
+            self._closed = True
+        for http in self._lazy_clients.values():
+            http.close()
         self._http.close()
 
     def __enter__(self) -> "SuperMeClient":
@@ -206,6 +283,9 @@ class AsyncSuperMeClient(
 
             async for event in client.stream_interview("interview_abc123"):
                 print(event)
+
+    ``http2=True`` and ``cache_enabled`` behave as on :class:`SuperMeClient`;
+    HTTP/2 pays off most here, where many requests are typically in flight.
     """
 
     def __init__(
@@ -215,6 +295,10 @@ class AsyncSuperMeClient(
         rest_base_url: str = "https://www.superme.ai",
         partner_base_url: str = "https://api.superme.ai",
         timeout: float = 120.0,
+        http2: bool = False,
+        max_retries: int = 2,
+        cache_enabled: bool = False,
+        cache_size: int = 256,
     ):
         if not api_key:
             raise ValueError("api_key is required")
@@ -222,28 +306,23 @@ class AsyncSuperMeClient(
         self.base_url = base_url.rstrip("/")
         self.rest_base_url = rest_base_url.rstrip("/")
         self.partner_base_url = partner_base_url.rstrip("/")
-        _auth_headers = {
+        self._auth_headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json, text/event-stream",
         }
-        self._async_http = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=_auth_headers,
-            timeout=timeout,
-            follow_redirects=True,
-        )
-        self._async_rest_http = httpx.AsyncClient(
-            base_url=self.rest_base_url,
-            headers=dict(_auth_headers),
-            timeout=timeout,
-        )
-        self._async_partner_http = httpx.AsyncClient(
-            base_url=self.partner_base_url,
-            headers=dict(_auth_headers),
-            timeout=timeout,
-        )
+        self._timeout = timeout
+        self._http2 = http2
+        self._max_retries = max_retries
+        # reentrant: _lazy_http holds it while _make_http takes it again
+        self._lazy_lock = threading.RLock()
+        self._closed = False
+        self._lazy_clients: dict[str, httpx.AsyncClient] = {}
+        self._async_http = self._make_async_http(self.base_url, follow_redirects=True)
         self._rpc_id = 0
+        self._answer_cache = AnswerCache(cache_size) if cache_enabled else None
+        self._last_conversation_id: Optional[str] = None
+        self._inflight = AsyncSingleFlight()
 
     # ------------------------------------------------------------------
     # Properties (mirrors SuperMeClient)
@@ -259,14 +338,62 @@ class AsyncSuperMeClient(
         """Extract user_id from the JWT token payload."""
         return _decode_jwt(self.api_key).get("user_id")
 
+    @property
+    def last_conversation_id(self) -> Optional[str]:
+        """Conversation ID returned by the most recent ``ask`` on this client.
+
+        Pass it as ``conversation_id`` to continue that thread. Only the new
+        question is sent each turn — the server holds the history.
+        """
+        return self._last_conversation_id
+
+    # ------------------------------------------------------------------
+    # HTTP clients (REST / partner built on first use, as on SuperMeClient)
+    # ------------------------------------------------------------------
+
+    def _make_async_http(self, base_url: str, **kwargs: Any) -> httpx.AsyncClient:
+        """Async twin of :meth:`SuperMeClient._make_http` (also refuses once closed)."""
+
+        def _transport(
+            proxy: Optional[httpx.Proxy] = None,
+        ) -> httpx.AsyncHTTPTransport:
+            return httpx.AsyncHTTPTransport(
+                http2=self._http2, retries=self._max_retries, proxy=proxy
+            )
+
+        with self._lazy_lock:
+            self._ensure_open()
+            return httpx.AsyncClient(
+                base_url=base_url,
+                headers=dict(self._auth_headers),
+                timeout=self._timeout,
+                transport=_transport(),
+                mounts=env_proxy_mounts(_transport),
+                **kwargs,
+            )
+
+    @property
+    def _async_rest_http(self) -> httpx.AsyncClient:
+        return self._lazy_http(
+            "rest", lambda: self._make_async_http(self.rest_base_url)
+        )
+
+    @property
+    def _async_partner_http(self) -> httpx.AsyncClient:
+        return self._lazy_http(
+            "partner", lambda: self._make_async_http(self.partner_base_url)
+        )
+
     # ------------------------------------------------------------------
     # Async context manager / cleanup
     # ------------------------------------------------------------------
 
     async def aclose(self) -> None:
-        """Close the underlying async HTTP clients."""
-        await self._async_partner_http.aclose()
-        await self._async_rest_http.aclose()
+        """Close the underlying async HTTP clients (see :meth:`SuperMeClient.close`)."""
+        with self._lazy_lock:
+            self._closed = True
+        for http in list(self._lazy_clients.values()):
+            await http.aclose()
         await self._async_http.aclose()
 
     async def __aenter__(self) -> "AsyncSuperMeClient":
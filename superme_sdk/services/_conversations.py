@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import warnings
-from collections.abc import Iterator
-from typing import Any, Literal, Optional, overload
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any, Literal, Optional, Union, overload
 
+from .._transport._cache import MISS, cache_key
+from .._transport._chat_proxy import ask_arguments
 from .._transport._terminals import ASK_TERMINAL
 from ..streaming import PartnerStreamChunk
 
+_ASK_MANY_CONCURRENCY = 8
+
+
+def _pair_usernames(questions: list[str], username: Union[str, list[str]]) -> list[str]:
+    """Broadcast a single username, or validate a per-question list."""
+    if isinstance(username, str):
+        return [username] * len(questions)
+    if len(username) != len(questions):
+        raise ValueError("username list must be the same length as questions")
+    return list(username)
+
 
 class ConversationsMixin:
     @overload
@@ -76,6 +90,12 @@ class ConversationsMixin:
             chunk dicts (``type``: ``content``/``tool``/``done``/``error``),
             stopping after ``done`` or ``error``. ``incognito`` and
             ``max_tokens`` do not apply to the streaming path.
+
+        Note:
+            With ``cache_enabled=True`` on the client, repeating a
+            non-streaming call with identical arguments returns the cached
+            answer without contacting the server. Streaming calls are never
+            cached.
         """
         if stream:
             body: dict[str, Any] = {
@@ -85,22 +105,135 @@ class ConversationsMixin:
             }
             if conversation_id:
                 body["conversation_id"] = conversation_id
-            return self._iter_sse(
-                self._partner_http,
-                "POST",
-                "/partner/ask",
-                json=body,
-                is_terminal=lambda o: o.get("type") in ASK_TERMINAL,
+            return self._track_conversation(
+                self._iter_sse(
+                    self._partner_http,
+                    "POST",
+                    "/partner/ask",
+                    json=body,
+                    is_terminal=lambda o: o.get("type") in ASK_TERMINAL,
+                )
             )
-        response = self.chat.completions.create(
-            messages=[{"role": "user", "content": question}],
-            username=username,
-            conversation_id=conversation_id,
-            max_tokens=max_tokens,
-            incognito=incognito,
-            **kwargs,
-        )
-        return response.choices[0].message.content
+        key = None
+        if self._answer_cache is not None:
+            key = cache_key(
+                "ask",
+                question,
+                username,
+                conversation_id,
+                max_tokens,
+                incognito,
+                **kwargs,
+            )
+
+        def _fetch() -> tuple:
+            response = self.chat.completions.create(
+                messages=[{"role": "user", "content": question}],
+                username=username,
+                conversation_id=conversation_id,
+                max_tokens=max_tokens,
+                incognito=incognito,
+                **kwargs,
+            )
+            conv_id = (response.metadata or {}).get("conversation_id")
+            return response.choices[0].message.content, conv_id
+
+        answer, conv_id = self._cached(key, _fetch)
+        # re-record on cache hits too, so last_conversation_id always
+        # belongs to the answer just returned
+        if conv_id:
+            self._last_conversation_id = conv_id
+        return answer
+
+    def ask_many(
+        self,
+        questions: list[str],
+        username: Union[str, list[str]] = "ludo",
+        *,
+        max_concurrent: int = _ASK_MANY_CONCURRENCY,
+        max_tokens: int = 1000,
+        incognito: bool = False,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Ask several independent questions concurrently.
+
+        Fans out up to ``max_concurrent`` requests using a dedicated
+        batch-scoped HTTP client (avoids sharing the main client across
+        threads). Each question starts its own conversation; answers come
+        back in the same order as ``questions``. :attr:`last_conversation_id`
+        is left unchanged — concurrent answers have no meaningful "last".
+
+        Example:
+            ```python
+            answers = client.ask_many(
+                ["What is PMF?", "How do you measure it?"], username="ludo"
+            )
+
+            # one question, several agents
+            answers = client.ask_many(["What is PMF?"] * 2, username=["ludo", "casey"])
+            ```
+
+        Args:
+            questions: Questions to ask.
+            username: Target username for every question, or one per question.
+            max_concurrent: Maximum requests in flight at once.
+            max_tokens: Max response tokens.
+            incognito: Ask anonymously.
+            return_exceptions: If True, a failed question's slot holds the
+                exception instead of an answer. Otherwise the first failure
+                is raised once every request has finished.
+
+        Returns:
+            List of answer strings (or exceptions) aligned with ``questions``.
+        """
+        usernames = _pair_usernames(questions, username)
+        results: list[Any] = [None] * len(questions)
+        batch_client = self._make_http(self.base_url, follow_redirects=True)
+
+        def _one(index: int, question: str, user: str) -> None:
+            key = None
+            if self._answer_cache is not None:
+                key = cache_key("ask", question, user, None, max_tokens, incognito)
+
+            def _fetch() -> tuple:
+                result = self._mcp_tool_call(
+                    "ask",
+                    ask_arguments(question, user, incognito=incognito),
+                    http=batch_client,
+                )
+                return result.get("response", ""), result.get("conversation_id")
+
+            try:
+                results[index] = self._cached(key, _fetch)[0]
+            except Exception as exc:  # noqa: BLE001
+                results[index] = exc
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, max_concurrent)
+            ) as pool:
+                futs = [
+                    pool.submit(_one, i, q, u)
+                    for i, (q, u) in enumerate(zip(questions, usernames))
+                ]
+                concurrent.futures.wait(futs)
+        finally:
+            batch_client.close()
+
+        if not return_exceptions:
+            for r in results:
+                if isinstance(r, Exception):
+                    raise r
+        return results
+
+    def _track_conversation(
+        self, chunks: Iterator[PartnerStreamChunk]
+    ) -> Iterator[PartnerStreamChunk]:
+        """Pass chunks through, recording the ``done`` chunk's conversation ID."""
+        for chunk in chunks:
+            if chunk.get("type") == "done" and chunk.get("conversation_id"):
+                self._last_conversation_id = chunk["conversation_id"]
+            yield chunk
 
     def ask_with_history(
         self,
@@ -145,16 +278,64 @@ class ConversationsMixin:
             DeprecationWarning,
             stacklevel=2,
         )
-        response = self.chat.completions.create(
-            messages=messages,
-            username=username,
-            conversation_id=conversation_id,
-            max_tokens=max_tokens,
-            incognito=incognito,
-            **kwargs,
-        )
-        conv_id = (response.metadata or {}).get("conversation_id")
-        return response.choices[0].message.content, conv_id
+        key = None
+        if self._answer_cache is not None:
+            turns = tuple((m.get("role"), m.get("content")) for m in messages)
+            key = cache_key(
+                "ask_with_history",
+                turns,
+                username,
+                conversation_id,
+                max_tokens,
+                incognito,
+                **kwargs,
+            )
+
+        def _fetch() -> tuple:
+            response = self.chat.completions.create(
+                messages=messages,
+                username=username,
+                conversation_id=conversation_id,
+                max_tokens=max_tokens,
+                incognito=incognito,
+                **kwargs,
+            )
+            conv_id = (response.metadata or {}).get("conversation_id")
+            return response.choices[0].message.content, conv_id
+
+        answer, conv_id = self._cached(key, _fetch)
+        if conv_id:
+            self._last_conversation_id = conv_id
+        return answer, conv_id
+
+    def _cached(self, key: Optional[Hashable], fetch: Callable[[], Any]) -> Any:
+        """Serve ``key`` from the answer cache, else run ``fetch`` and cache it.
+
+        Concurrent misses on the same key share one ``fetch`` (single-flight).
+        ``key`` is None when caching is disabled or the call is uncacheable.
+        """
+        if key is None:
+            return fetch()
+        cached = self._answer_cache.get(key)
+        if cached is not MISS:
+            return cached
+
+        def _fill() -> Any:
+            # a previous leader may have filled the cache between the
+            # lookup above and this call taking the lead
+            value = self._answer_cache.get(key)
+            if value is not MISS:
+                return value
+            value = fetch()
+            self._answer_cache.put(key, value)
+            return value
+
+        return self._inflight.do(key, _fill)
+
+    def clear_cache(self) -> None:
+        """Drop every cached answer (no-op when caching is disabled)."""
+        if self._answer_cache is not None:
+            self._answer_cache.clear()
 
     def mcp_tool_call(
         self, tool_name: str, arguments: dict
@@ -5,8 +5,6 @@ from __future__ import annotations
 import concurrent.futures
 from typing import Any, Optional
 
-import httpx
-
 from superme_sdk.models import (
     ProvisionCreateResponse,
     ProvisionInviteResponse,
@@ -143,15 +141,7 @@ class ProvisionMixin:
         results: list[dict[str, Any]] = [{}] * len(profiles)
 
         # Fresh client scoped to this batch — avoids sharing self._rest_http across threads.
-        batch_client = httpx.Client(
-            base_url=self.rest_base_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream",
-            },
-            timeout=self._rest_http.timeout,
-        )
+        batch_client = self._make_http(self.rest_base_url)
 
         def _one(index: int, profile: dict[str, Any]) -> None:
             try:
@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator, Awaitable
-from typing import Any, Literal, Optional, overload
+from typing import Any, Literal, Optional, Union, overload
 
+from ..._transport._cache import MISS, cache_key
 from ..._transport._terminals import ASK_TERMINAL
 from ...streaming import PartnerStreamChunk
+from .._conversations import _ASK_MANY_CONCURRENCY, _pair_usernames
+
+
+def _ask_body(
+    question: str,
+    username: str,
+    conversation_id: Optional[str] = None,
+    *,
+    stream: bool = False,
+) -> dict[str, Any]:
+    """Build a ``/partner/ask`` request body."""
+    body: dict[str, Any] = {
+        "identifier": username,
+        "question": question,
+        "stream": stream,
+    }
+    if conversation_id:
+        body["conversation_id"] = conversation_id
+    return body
 
 
 class AsyncConversationsMixin:
@@ -20,6 +41,8 @@ class AsyncConversationsMixin:
 
     Note: unlike the sync client, async non-streaming ``ask`` is served by the
     partner endpoint and does not support ``incognito`` / ``max_tokens``.
+    With ``cache_enabled=True`` it is cached exactly like the sync ``ask``,
+    and concurrent identical calls share a single in-flight request.
     """
 
     @overload
@@ -67,25 +90,142 @@ class AsyncConversationsMixin:
             ``content``/``tool``/``done``/``error``). ``incognito`` /
             ``max_tokens`` are not supported on the async path.
         """
-        body: dict[str, Any] = {
-            "identifier": username,
-            "question": question,
-            "stream": stream,
-        }
-        if conversation_id:
-            body["conversation_id"] = conversation_id
+        body = _ask_body(question, username, conversation_id, stream=stream)
         if stream:
-            return self._aiter_sse(
-                self._async_partner_http,
-                "POST",
-                "/partner/ask",
-                json=body,
-                is_terminal=lambda o: o.get("type") in ASK_TERMINAL,
+            return self._atrack_conversation(
+                self._aiter_sse(
+                    self._async_partner_http,
+                    "POST",
+                    "/partner/ask",
+                    json=body,
+                    is_terminal=lambda o: o.get("type") in ASK_TERMINAL,
+                )
+            )
+        return self._ask_recording(body)
+
+    async def _ask_recording(self, body: dict) -> str:
+        answer, conv_id = await self._ask_nonstream(body)
+        # recorded here rather than per request, so cache hits update it and
+        # ask_many / iask_many leave it alone (as on the sync client)
+        if conv_id:
+            self._last_conversation_id = conv_id
+        return answer
+
+    async def _atrack_conversation(
+        self, chunks: AsyncIterator[PartnerStreamChunk]
+    ) -> AsyncIterator[PartnerStreamChunk]:
+        """Async twin of ``ConversationsMixin._track_conversation``."""
+        try:
+            async for chunk in chunks:
+                if chunk.get("type") == "done" and chunk.get("conversation_id"):
+                    self._last_conversation_id = chunk["conversation_id"]
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    async def ask_many(
+        self,
+        questions: list[str],
+        username: Union[str, list[str]] = "ludo",
+        *,
+        max_concurrent: int = _ASK_MANY_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Ask several independent questions concurrently (async).
+
+        Runs the questions through ``asyncio.gather`` with at most
+        ``max_concurrent`` in flight; answers are returned in the same order
+        as ``questions``. :attr:`last_conversation_id` is left unchanged.
+
+        Example:
+            ```python
+            answers = await client.ask_many(
+                ["What is PMF?"] * 2, username=["ludo", "casey"]
             )
-        return self._ask_nonstream(body)
+            ```
+
+        Args:
+            questions: Questions to ask.
+            username: Target username for every question, or one per question.
+            max_concurrent: Maximum requests in flight at once.
+            return_exceptions: Passed to ``asyncio.gather`` — if True, a
+                failed question's slot holds the exception.
+        """
+        usernames = _pair_usernames(questions, username)
+        sem = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def _one(question: str, user: str) -> str:
+            async with sem:
+                return (await self._ask_nonstream(_ask_body(question, user)))[0]
 
-    async def _ask_nonstream(self, body: dict) -> str:
+        return await asyncio.gather(
+            *[_one(q, u) for q, u in zip(questions, usernames)],
+            return_exceptions=return_exceptions,
+        )
+
+    async def iask_many(
+        self,
+        questions: list[str],
+        username: Union[str, list[str]] = "ludo",
+        *,
+        max_concurrent: int = _ASK_MANY_CONCURRENCY,
+    ) -> AsyncIterator[tuple[int, str]]:
+        """Like :meth:`ask_many`, but yield ``(index, answer)`` as each finishes.
+
+        Completion order, not input order — use ``index`` to match answers
+        to ``questions``. Leaving the loop early cancels outstanding requests.
+
+        Example:
+            ```python
+            async for i, answer in client.iask_many(questions, username="ludo"):
+                print(questions[i], "->", answer)
+            ```
+        """
+        usernames = _pair_usernames(questions, username)
+        sem = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def _one(index: int, question: str, user: str) -> tuple[int, str]:
+            async with sem:
+                answer, _ = await self._ask_nonstream(_ask_body(question, user))
+                return index, answer
+
+        tasks = [
+            asyncio.ensure_future(_one(i, q, u))
+            for i, (q, u) in enumerate(zip(questions, usernames))
+        ]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                yield await fut
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _ask_nonstream(self, body: dict) -> tuple[str, Optional[str]]:
+        if self._answer_cache is None:
+            return await self._post_partner_ask(body)
+        key = cache_key("ask", **body)
+        cached = self._answer_cache.get(key)
+        if cached is not MISS:
+            return cached
+
+        async def _fill() -> tuple[str, Optional[str]]:
+            answer = await self._post_partner_ask(body)
+            self._answer_cache.put(key, answer)
+            return answer
+
+        # concurrent misses on the same key share one request (single-flight)
+        return await self._inflight.do(key, _fill)
+
+    async def _post_partner_ask(self, body: dict) -> tuple[str, Optional[str]]:
+        """POST a non-streaming ask; return ``(answer, conversation_id)``."""
         resp = await self._async_partner_http.post("/partner/ask", json=body)
         self._check_rest_response(resp)
         data = resp.json()
-        return data.get("answer", "") if isinstance(data, dict) else ""
+        if not isinstance(data, dict):
+            return "", None
+        return data.get("answer", ""), data.get("conversation_id")
+
+    def clear_cache(self) -> None:
+        """Drop every cached answer (no-op when caching is disabled)."""
+        if self._answer_cache is not None:
+            self._answer_cache.clear()
@@ -11,8 +11,11 @@ Discriminate on ``type``; the stream stops after ``done`` or ``error``.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterable, Iterable
 from typing import Literal, TypedDict, Union
 
+from .exceptions import APIError
+
 
 class ContentChunk(TypedDict):
     """A piece of the answer text."""
@@ -44,3 +47,35 @@ class ErrorChunk(TypedDict):
 
 PartnerStreamChunk = Union[ContentChunk, ToolChunk, DoneChunk, ErrorChunk]
 """Every chunk a partner stream can yield. Stops after ``done`` or ``error``."""
+
+
+def stream_to_string(chunks: Iterable[PartnerStreamChunk]) -> str:
+    """Drain a stream and return the concatenated ``content`` text.
+
+    For callers that want streaming's early start on the wire but only need
+    the final answer. Raises :class:`~superme_sdk.APIError` on an ``error``
+    chunk.
+
+    Example:
+        ```python
+        answer = stream_to_string(client.ask("What is PMF?", stream=True))
+        ```
+    """
+    parts: list[str] = []
+    for chunk in chunks:
+        if chunk["type"] == "content":
+            parts.append(chunk["text"])
+        elif chunk["type"] == "error":
+            raise APIError(chunk.get("message") or "stream failed")
+    return "".join(parts)
+
+
+async def astream_to_string(chunks: AsyncIterable[PartnerStreamChunk]) -> str:
+    """Async twin of :func:`stream_to_string`."""
+    parts: list[str] = []
+    async for chunk in chunks:
+        if chunk["type"] == "content":
+            parts.append(chunk["text"])
+        elif chunk["type"] == "error":
+            raise APIError(chunk.get("message") or "stream failed")
+    return "".join(parts)
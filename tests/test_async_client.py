@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 import httpx
@@ -44,6 +45,18 @@ async def test_async_client_context_manager():
         assert client.token == "tok"
 
 
+async def test_async_client_builds_rest_and_partner_clients_lazily():
+    client = AsyncSuperMeClient(api_key="tok")
+    assert client._lazy_clients == {}
+    partner = client._async_partner_http
+    assert client._async_partner_http is partner
+    assert list(client._lazy_clients) == ["partner"]
+    await client.aclose()
+    assert partner.is_closed
+    with pytest.raises(RuntimeError, match="closed"):
+        _ = client._async_rest_http
+
+
 # ---------------------------------------------------------------------------
 # stream_interview
 # ---------------------------------------------------------------------------
@@ -127,6 +140,131 @@ async def test_get_agentic_resume_404_returns_null_structured_data():
     assert result["structured_data"] is None
 
 
+# ---------------------------------------------------------------------------
+# raw_request
+# ---------------------------------------------------------------------------
+
+
+@respx.mock
+async def test_async_raw_request_returns_result():
+    route = respx.post(f"{MCP_BASE}/mcp/").mock(
+        return_value=httpx.Response(
+            200,
+            json={"jsonrpc": "2.0", "id": 1, "result": {"tools": [{"name": "ask"}]}},
+        )
+    )
+    async with AsyncSuperMeClient(api_key="tok") as client:
+        result = await client.raw_request("tools/list")
+    assert result == {"tools": [{"name": "ask"}]}
+    assert json.loads(route.calls[0].request.content)["method"] == "tools/list"
+
+
+@respx.mock
+async def test_async_ask_cache_hit_skips_request():
+    route = respx.post("https://api.superme.ai/partner/ask").mock(
+        return_value=httpx.Response(200, json={"answer": "PMF is retention."})
+    )
+    async with AsyncSuperMeClient(api_key="tok", cache_enabled=True) as client:
+        assert await client.ask("What is PMF?") == "PMF is retention."
+        assert await client.ask("What is PMF?") == "PMF is retention."
+        assert route.call_count == 1
+        client.clear_cache()
+        await client.ask("What is PMF?")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_async_ask_records_last_conversation_id():
+    respx.post("https://api.superme.ai/partner/ask").mock(
+        return_value=httpx.Response(200, json={"answer": "a", "conversation_id": "c9"})
+    )
+    async with AsyncSuperMeClient(api_key="tok") as client:
+        assert client.last_conversation_id is None
+        await client.ask("hi")
+        assert client.last_conversation_id == "c9"
+
+
+def _echo_partner_ask(request):
+    body = json.loads(request.content)
+    return httpx.Response(
+        200,
+        json={
+            "answer": f"{body['identifier']}: {body['question']}",
+            "conversation_id": f"conv_{body['identifier']}",
+        },
+    )
+
+
+@respx.mock
+async def test_async_ask_many_preserves_order():
+    respx.post("https://api.superme.ai/partner/ask").mock(side_effect=_echo_partner_ask)
+    async with AsyncSuperMeClient(api_key="tok") as client:
+        answers = await client.ask_many(
+            ["q1", "q2", "q3"], username=["ludo", "casey", "ludo"], max_concurrent=2
+        )
+    assert answers == ["ludo: q1", "casey: q2", "ludo: q3"]
+
+
+@respx.mock
+async def test_async_iask_many_yields_every_index():
+    respx.post("https://api.superme.ai/partner/ask").mock(side_effect=_echo_partner_ask)
+    async with AsyncSuperMeClient(api_key="tok") as client:
+        results = dict([r async for r in client.iask_many(["a", "b", "c"])])
+    assert results == {0: "ludo: a", 1: "ludo: b", 2: "ludo: c"}
+
+
+@respx.mock
+async def test_async_cached_ask_records_its_own_conversation_id():
+    respx.post("https://api.superme.ai/partner/ask").mock(side_effect=_echo_partner_ask)
+    async with AsyncSuperMeClient(api_key="tok", cache_enabled=True) as client:
+        await client.ask("q", "ludo")
+        await client.ask("q", "casey")
+        assert await client.ask("q", "ludo") == "ludo: q"
+        assert client.last_conversation_id == "conv_ludo"
+
+
+@respx.mock
+async def test_async_ask_many_leaves_last_conversation_id_unchanged():
+    respx.post("https://api.superme.ai/partner/ask").mock(side_effect=_echo_partner_ask)
+    async with AsyncSuperMeClient(api_key="tok") as client:
+        await client.ask("q", "ludo")
+        await client.ask_many(["a", "b"], username=["casey", "alice"])
+        async for _ in client.iask_many(["c"], username="casey"):
+            pass
+        assert client.last_conversation_id == "conv_ludo"
+
+
+@respx.mock
+async def test_async_concurrent_identical_asks_share_one_request():
+    async def _slow(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"answer": "shared"})
+
+    route = respx.post("https://api.superme.ai/partner/ask").mock(side_effect=_slow)
+    async with AsyncSuperMeClient(api_key="tok", cache_enabled=True) as client:
+        answers = await asyncio.gather(*[client.ask("q") for _ in range(5)])
+    assert answers == ["shared"] * 5
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_async_single_flight_survives_leader_cancellation():
+    async def _slow(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"answer": "shared"})
+
+    route = respx.post("https://api.superme.ai/partner/ask").mock(side_effect=_slow)
+    async with AsyncSuperMeClient(api_key="tok", cache_enabled=True) as client:
+        leader = asyncio.ensure_future(client.ask("q"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(client.ask("q"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == "shared"
+        assert leader.cancelled()
+    assert route.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # error handling
 # ---------------------------------------------------------------------------
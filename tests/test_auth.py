@@ -1,8 +1,23 @@
 """Tests for superme_sdk.auth — token persistence."""
 
+import base64
+import json
+import time
+
 import pytest
 
-from superme_sdk.auth import load_token, save_token, remove_token, resolve_token
+from superme_sdk.auth import (
+    load_token,
+    save_token,
+    remove_token,
+    resolve_token,
+    token_expired,
+)
+
+
+def _jwt(payload: dict) -> str:
+    body = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJIUzI1NiJ9.{body.decode()}.sig"
 
 
 @pytest.fixture()
@@ -58,6 +73,12 @@ def test_save_token_overwrites(token_file):
     assert load_token(token_file) == "new"
 
 
+def test_save_token_leaves_no_temp_files(token_file):
+    save_token("tok_a", token_file)
+    save_token("tok_b", token_file)
+    assert [p.name for p in token_file.parent.iterdir()] == [token_file.name]
+
+
 # ---- remove_token ----
 
 
@@ -98,3 +119,30 @@ def test_resolve_token_falls_back_to_file(token_file, monkeypatch):
 def test_resolve_token_returns_none_when_nothing(token_file, monkeypatch):
     monkeypatch.delenv("SUPERME_API_KEY", raising=False)
     assert resolve_token(token_file=token_file) is None
+
+
+def test_resolve_token_skips_expired_file_jwt(token_file, monkeypatch):
+    monkeypatch.delenv("SUPERME_API_KEY", raising=False)
+    save_token(_jwt({"user_id": "u1", "exp": time.time() - 10}), token_file)
+    assert resolve_token(token_file=token_file) is None
+
+
+def test_resolve_token_keeps_valid_file_jwt(token_file, monkeypatch):
+    monkeypatch.delenv("SUPERME_API_KEY", raising=False)
+    tok = _jwt({"user_id": "u1", "exp": time.time() + 3600})
+    save_token(tok, token_file)
+    assert resolve_token(token_file=token_file) == tok
+
+
+# ---- token_expired ----
+
+
+def test_token_expired():
+    assert token_expired(_jwt({"exp": time.time() - 1})) is True
+    assert token_expired(_jwt({"exp": time.time() + 3600})) is False
+    assert token_expired(_jwt({"exp": time.time() + 30}), leeway=60) is True
+
+
+def test_token_expired_false_without_exp():
+    assert token_expired("opaque-api-key") is False
+    assert token_expired(_jwt({"user_id": "u1"})) is False
@@ -253,6 +253,26 @@ def test_chat_completions_create_extra_body_conversation_id():
         client.close()
 
 
+@respx.mock
+def test_chat_completions_create_does_not_mutate_extra_body():
+    """A shared extra_body template must be reusable across calls."""
+    route = _mock_ask()
+    template = {"username": "alice"}
+    client = SuperMeClient(api_key="tok")
+    for conv in (None, "conv_1"):
+        client.chat.completions.create(
+            messages=[{"role": "user", "content": "hi"}],
+            conversation_id=conv,
+            extra_body=template,
+        )
+    assert template == {"username": "alice"}
+    args = [json.loads(c.request.content)["params"]["arguments"] for c in route.calls]
+    assert [a["identifier"] for a in args] == ["alice", "alice"]
+    assert "conversation_id" not in args[0]
+    assert args[1]["conversation_id"] == "conv_1"
+    client.close()
+
+
 @respx.mock
 def test_chat_completions_create_returns_response_with_content():
     """Pre-hardening: create() response exposes .choices[0].message.content."""
@@ -1,11 +1,23 @@
 """Tests for superme_sdk.client — SuperMeClient (MCP JSON-RPC transport)."""
 
+import importlib
 import json
+import math
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
+import httpcore
 import httpx
 import pytest
 import respx
 
+import superme_sdk
+import superme_sdk._default
+import superme_sdk._transport._json as json_codec
+from superme_sdk._transport._cache import cache_key
+from superme_sdk._transport._singleflight import SingleFlight
 from superme_sdk.client import SuperMeClient, ChatCompletion
 from superme_sdk.exceptions import (
     AuthError,
@@ -60,6 +72,203 @@ def test_client_explicit_key():
     client.close()
 
 
+@respx.mock
+def test_client_http2_opt_in():
+    pytest.importorskip("h2")
+    _mock_mcp_ask()
+    with SuperMeClient(api_key="tok", http2=True) as client:
+        assert client.ask("hi", username="ludo") == "Growth marketing is..."
+
+
+def test_client_builds_rest_and_partner_clients_lazily():
+    client = SuperMeClient(api_key="tok")
+    assert client._lazy_clients == {}
+    rest = client._rest_http
+    assert client._rest_http is rest
+    assert rest.headers["authorization"] == "Bearer tok"
+    assert list(client._lazy_clients) == ["rest"]
+    client.close()
+    assert rest.is_closed
+    client.close()
+
+
+def test_client_does_not_rebuild_http_clients_after_close():
+    client = SuperMeClient(api_key="tok")
+    rest = client._rest_http
+    client.close()
+    assert client._rest_http is rest
+    with pytest.raises(RuntimeError, match="closed"):
+        client.get_interview_status("i1")
+    with pytest.raises(RuntimeError, match="closed"):
+        _ = client._partner_http
+    assert list(client._lazy_clients) == ["rest"]
+
+
+@respx.mock
+def test_client_batch_methods_refuse_after_close():
+    mcp = respx.post(f"{MCP_BASE}/mcp/").mock(side_effect=_echo_ask)
+    rest = respx.post("https://www.superme.ai/api/v3/provision/comm_1").mock(
+        return_value=httpx.Response(200, json={"provision": {"user_id": "u1"}})
+    )
+    client = SuperMeClient(api_key="tok")
+    client.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        client.ask_many(["q"])
+    with pytest.raises(RuntimeError, match="closed"):
+        client.provision_create_batch("comm_1", [{"email": "a@example.com"}])
+    assert not mcp.called and not rest.called
+
+
+def test_client_builds_lazy_http_client_once_across_threads(monkeypatch):
+    client = SuperMeClient(api_key="tok")
+    built = []
+    make_http = client._make_http
+
+    def _slow_make_http(base_url, **kwargs):
+        time.sleep(0.05)
+        built.append(base_url)
+        return make_http(base_url, **kwargs)
+
+    monkeypatch.setattr(client, "_make_http", _slow_make_http)
+    seen = []
+    threads = [
+        threading.Thread(target=lambda: seen.append(client._rest_http))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert built == [client.rest_base_url]
+    assert len({id(http) for http in seen}) == 1
+    client.close()
+
+
+_PROXY_ENV = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY")
+
+
+@pytest.fixture()
+def local_server(monkeypatch):
+    """Plain-HTTP JSON-RPC server on localhost; records request targets."""
+    for var in _PROXY_ENV:
+        monkeypatch.delenv(var, raising=False)
+        monkeypatch.delenv(var.lower(), raising=False)
+    paths = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            paths.append(self.path)
+            body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"ok": True}})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    server.paths = paths
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def flaky_connect(monkeypatch):
+    """Make the next TCP connect attempt fail once."""
+    original = httpcore.SyncBackend.connect_tcp
+    failures = [httpcore.ConnectError("connection refused")]
+
+    def _connect(self, *args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(httpcore.SyncBackend, "connect_tcp", _connect)
+
+
+def test_client_retries_failed_connects(local_server, flaky_connect):
+    with SuperMeClient(api_key="tok", base_url=local_server.url) as client:
+        assert client.raw_request("tools/list") == {"ok": True}
+
+
+def test_client_max_retries_zero_raises_connect_error(local_server, flaky_connect):
+    client = SuperMeClient(api_key="tok", base_url=local_server.url, max_retries=0)
+    with pytest.raises(httpx.ConnectError):
+        client.raw_request("tools/list")
+    client.close()
+
+
+def test_client_honours_environment_proxy(local_server, monkeypatch):
+    monkeypatch.setenv("HTTP_PROXY", local_server.url)
+    with SuperMeClient(api_key="tok", base_url="http://mcp.example.invalid") as client:
+        # the request goes to the proxy, never to the (unresolvable) host
+        assert client.raw_request("tools/list") == {"ok": True}
+    assert local_server.paths == ["http://mcp.example.invalid/mcp/"]
+
+
+def test_client_no_proxy_bypasses_environment_proxy(local_server, monkeypatch):
+    monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    with SuperMeClient(api_key="tok", base_url=local_server.url) as client:
+        assert client.raw_request("tools/list") == {"ok": True}
+    assert local_server.paths == ["/mcp/"]
+
+
+# ---- get_default_client ----
+
+
+@pytest.fixture()
+def fresh_default(monkeypatch):
+    monkeypatch.setattr(superme_sdk._default, "_default", None)
+
+
+def test_get_default_client_reuses_instance(fresh_default):
+    a = superme_sdk.get_default_client(api_key="tok")
+    assert superme_sdk.get_default_client(api_key="tok") is a
+    b = superme_sdk.get_default_client(api_key="tok", timeout=5.0)
+    assert b is not a
+    a.close()
+    b.close()
+
+
+def test_get_default_client_resolves_token(fresh_default, monkeypatch):
+    monkeypatch.setenv("SUPERME_API_KEY", "env-tok")
+    client = superme_sdk.get_default_client()
+    assert client.token == "env-tok"
+    assert superme_sdk.get_default_client(api_key="env-tok") is client
+    client.close()
+
+
+def test_get_default_client_replaces_closed_client(fresh_default):
+    with superme_sdk.get_default_client(api_key="tok") as first:
+        pass
+    second = superme_sdk.get_default_client(api_key="tok")
+    assert second is not first
+    second.close()
+
+
+def test_get_default_client_is_thread_safe(fresh_default):
+    clients = []
+    threads = [
+        threading.Thread(
+            target=lambda: clients.append(superme_sdk.get_default_client(api_key="t"))
+        )
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(c) for c in clients}) == 1
+    clients[0].close()
+
+
 # ---- ask ----
 
 
@@ -110,6 +319,32 @@ def test_ask_sends_conversation_id():
     client.close()
 
 
+@respx.mock
+def test_ask_records_last_conversation_id():
+    _mock_mcp_ask()
+    client = SuperMeClient(api_key="tok")
+    assert client.last_conversation_id is None
+    client.ask("hi", username="ludo")
+    assert client.last_conversation_id == "conv_123"
+    client.close()
+
+
+@respx.mock
+def test_ask_stream_records_last_conversation_id():
+    respx.post("https://api.superme.ai/partner/ask").mock(
+        return_value=httpx.Response(
+            200,
+            content=b'data: {"type": "done", "conversation_id": "conv_s"}\n\n',
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+    client = SuperMeClient(api_key="tok")
+    chunks = list(client.ask("hi", username="ludo", stream=True))
+    assert chunks == [{"type": "done", "conversation_id": "conv_s"}]
+    assert client.last_conversation_id == "conv_s"
+    client.close()
+
+
 # ---- ask_with_history ----
 
 
@@ -142,6 +377,251 @@ def test_ask_with_history_extracts_last_user_message():
     client.close()
 
 
+# ---- answer cache ----
+
+
+@respx.mock
+def test_ask_not_cached_by_default():
+    route = _mock_mcp_ask()
+    client = SuperMeClient(api_key="tok")
+    client.ask("What is PMF?", username="ludo")
+    client.ask("What is PMF?", username="ludo")
+    assert route.call_count == 2
+    client.close()
+
+
+@respx.mock
+def test_ask_cache_hit_skips_request():
+    route = _mock_mcp_ask()
+    client = SuperMeClient(api_key="tok", cache_enabled=True)
+    first = client.ask("What is PMF?", username="ludo")
+    second = client.ask("What is PMF?", username="ludo")
+    assert first == second == "Growth marketing is..."
+    assert route.call_count == 1
+
+    client.ask("What is PMF?", username="casey")
+    client.ask("What is PMF?", username="ludo", conversation_id="conv_1")
+    assert route.call_count == 3
+
+    client.clear_cache()
+    client.ask("What is PMF?", username="ludo")
+    assert route.call_count == 4
+    client.close()
+
+
+@respx.mock
+def test_ask_cache_evicts_least_recently_used():
+    route = _mock_mcp_ask()
+    client = SuperMeClient(api_key="tok", cache_enabled=True, cache_size=2)
+    client.ask("a", username="ludo")
+    client.ask("b", username="ludo")
+    client.ask("a", username="ludo")  # hit — "b" is now the oldest
+    client.ask("c", username="ludo")  # evicts "b"
+    assert route.call_count == 3
+    client.ask("a", username="ludo")
+    assert route.call_count == 3
+    client.ask("b", username="ludo")
+    assert route.call_count == 4
+    client.close()
+
+
+@respx.mock
+def test_ask_stream_bypasses_cache():
+    route = respx.post("https://api.superme.ai/partner/ask").mock(
+        return_value=httpx.Response(
+            200,
+            content=b'data: {"type": "done", "conversation_id": "c1"}\n\n',
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+    client = SuperMeClient(api_key="tok", cache_enabled=True)
+    list(client.ask("hi", username="ludo", stream=True))
+    list(client.ask("hi", username="ludo", stream=True))
+    assert route.call_count == 2
+    client.close()
+
+
+@respx.mock
+def test_ask_with_history_cached_on_full_message_list():
+    route = _mock_mcp_ask()
+    client = SuperMeClient(api_key="tok", cache_enabled=True)
+    history = [
+        {"role": "user", "content": "Q1"},
+        {"role": "assistant", "content": "A1"},
+        {"role": "user", "content": "Q2"},
+    ]
+    assert client.ask_with_history(history, username="ludo") == (
+        "Growth marketing is...",
+        "conv_123",
+    )
+    client.ask_with_history(list(history), username="ludo")
+    assert route.call_count == 1
+    client.ask_with_history(history[2:], username="ludo")
+    assert route.call_count == 2
+    client.close()
+
+
+@respx.mock
+def test_concurrent_identical_asks_share_one_request():
+    def _slow(request):
+        time.sleep(0.2)
+        return httpx.Response(200, json=MCP_TOOL_RESPONSE)
+
+    route = respx.post(f"{MCP_BASE}/mcp/").mock(side_effect=_slow)
+    client = SuperMeClient(api_key="tok", cache_enabled=True)
+    answers = []
+    threads = [
+        threading.Thread(target=lambda: answers.append(client.ask("q", "ludo")))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert answers == ["Growth marketing is..."] * 4
+    assert route.call_count == 1
+    client.close()
+
+
+def test_cached_rechecks_cache_before_fetching():
+    client = SuperMeClient(api_key="tok", cache_enabled=True)
+    key = cache_key("ask", "q")
+    fetches = []
+    original_do = client._inflight.do
+
+    def _do(k, fn):
+        # simulate a previous leader filling the cache after our lookup
+        client._answer_cache.put(k, "cached")
+        return original_do(k, fn)
+
+    client._inflight.do = _do
+    assert client._cached(key, lambda: fetches.append(1) or "fresh") == "cached"
+    assert fetches == []
+    client.close()
+
+
+def test_single_flight_propagates_errors_to_waiters():
+    group = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def _boom():
+        started.set()
+        release.wait()
+        raise RuntimeError("boom")
+
+    def _call():
+        try:
+            group.do("k", _boom)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    leader = threading.Thread(target=_call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=_call)
+    follower.start()
+    release.set()
+    leader.join()
+    follower.join()
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+
+
+# ---- ask_many ----
+
+
+def _echo_ask(request):
+    """Respond to an MCP ask call with an answer naming the question and user."""
+    args = json.loads(request.content)["params"]["arguments"]
+    result = {
+        "response": f"{args['identifier']}: {args['question']}",
+        "conversation_id": f"conv_{args['identifier']}",
+    }
+    return httpx.Response(
+        200,
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"content": [{"type": "text", "text": json.dumps(result)}]},
+        },
+    )
+
+
+@respx.mock
+def test_cached_ask_records_its_own_conversation_id():
+    respx.post(f"{MCP_BASE}/mcp/").mock(side_effect=_echo_ask)
+    client = SuperMeClient(api_key="tok", cache_enabled=True)
+    client.ask("q", "ludo")
+    client.ask("q", "casey")
+    assert client.ask("q", "ludo") == "ludo: q"
+    assert client.last_conversation_id == "conv_ludo"
+    client.close()
+
+
+@respx.mock
+def test_ask_many_leaves_last_conversation_id_unchanged():
+    respx.post(f"{MCP_BASE}/mcp/").mock(side_effect=_echo_ask)
+    client = SuperMeClient(api_key="tok")
+    client.ask("q", "ludo")
+    client.ask_many(["a", "b"], username="casey")
+    assert client.last_conversation_id == "conv_ludo"
+    client.close()
+
+
+@respx.mock
+def test_ask_many_preserves_order():
+    respx.post(f"{MCP_BASE}/mcp/").mock(side_effect=_echo_ask)
+    client = SuperMeClient(api_key="tok")
+    questions = [f"q{i}" for i in range(5)]
+    answers = client.ask_many(questions, username="ludo", max_concurrent=3)
+    assert answers == [f"ludo: q{i}" for i in range(5)]
+    client.close()
+
+
+@respx.mock
+def test_ask_many_per_question_usernames():
+    route = respx.post(f"{MCP_BASE}/mcp/").mock(side_effect=_echo_ask)
+    client = SuperMeClient(api_key="my-jwt")
+    answers = client.ask_many(["q", "q"], username=["ludo", "casey"])
+    assert answers == ["ludo: q", "casey: q"]
+    assert {c.request.headers["authorization"] for c in route.calls} == {
+        "Bearer my-jwt"
+    }
+    with pytest.raises(ValueError, match="same length"):
+        client.ask_many(["q"], username=["ludo", "casey"])
+    client.close()
+
+
+@respx.mock
+def test_ask_many_failures():
+    def _fail_second(request):
+        if json.loads(request.content)["params"]["arguments"]["question"] == "bad":
+            return httpx.Response(500, json={"error": "boom"})
+        return _echo_ask(request)
+
+    respx.post(f"{MCP_BASE}/mcp/").mock(side_effect=_fail_second)
+    client = SuperMeClient(api_key="tok")
+    answers = client.ask_many(["ok", "bad"], return_exceptions=True)
+    assert answers[0] == "ludo: ok"
+    assert isinstance(answers[1], SuperMeError)
+    with pytest.raises(SuperMeError):
+        client.ask_many(["ok", "bad"])
+    client.close()
+
+
+@respx.mock
+def test_ask_many_shares_answer_cache():
+    route = respx.post(f"{MCP_BASE}/mcp/").mock(side_effect=_echo_ask)
+    client = SuperMeClient(api_key="tok", cache_enabled=True)
+    client.ask("q0", username="ludo")
+    client.ask_many(["q0", "q1"], username="ludo")
+    assert route.call_count == 2
+    assert client.ask("q1", username="ludo") == "ludo: q1"
+    assert route.call_count == 2
+    client.close()
+
+
 # ---- chat.completions.create ----
 
 
@@ -297,6 +777,106 @@ def test_low_level_list_tools():
     client.close()
 
 
+@respx.mock
+def test_raw_request_returns_result():
+    route = respx.post(f"{MCP_BASE}/mcp/").mock(
+        return_value=httpx.Response(
+            200,
+            json={"jsonrpc": "2.0", "id": 1, "result": {"tools": [{"name": "ask"}]}},
+        )
+    )
+    client = SuperMeClient(api_key="tok")
+    result = client.raw_request("tools/list")
+    assert result == {"tools": [{"name": "ask"}]}
+    body = json.loads(route.calls[0].request.content)
+    assert body["method"] == "tools/list"
+    assert body["params"] == {}
+    assert client.low_level.raw_request("tools/list") == result
+    client.close()
+
+
+@respx.mock
+def test_raw_request_reuses_pooled_client():
+    route = respx.post(f"{MCP_BASE}/mcp/").mock(
+        return_value=httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": {}})
+    )
+    client = SuperMeClient(api_key="my-jwt")
+    pool = client._http
+    client.raw_request("initialize")
+    client.raw_request("tools/list")
+    assert client._http is pool
+    assert [c.request.headers["authorization"] for c in route.calls] == [
+        "Bearer my-jwt",
+        "Bearer my-jwt",
+    ]
+    client.close()
+
+
+@pytest.mark.parametrize(
+    "base_url",
+    ["https://gw.example.com/superme", "https://gw.example.com/superme/"],
+)
+@respx.mock
+def test_base_url_path_prefix_is_kept(base_url):
+    mcp = respx.post("https://gw.example.com/superme/mcp/").mock(
+        return_value=httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": {}})
+    )
+    rest = respx.get("https://gw.example.com/rest/api/v3/interview/i1/status").mock(
+        return_value=httpx.Response(200, json={"status": "done"})
+    )
+    client = SuperMeClient(
+        api_key="tok",
+        base_url=base_url,
+        rest_base_url="https://gw.example.com/rest/",
+    )
+    client.raw_request("tools/list")
+    client.get_interview_status("i1")
+    assert mcp.called and rest.called
+    client.close()
+
+
+@respx.mock
+def test_provision_create_batch_sends_client_auth_headers():
+    route = respx.post("https://www.superme.ai/api/v3/provision/comm_1").mock(
+        return_value=httpx.Response(200, json={"provision": {"user_id": "u1"}})
+    )
+    client = SuperMeClient(api_key="my-jwt")
+    results = client.provision_create_batch(
+        "comm_1",
+        [{"name": "A", "linkedin_url": "https://linkedin.com/in/a"}] * 2,
+    )
+    assert results == [{"provision": {"user_id": "u1"}}] * 2
+    for call in route.calls:
+        assert call.request.headers["authorization"] == "Bearer my-jwt"
+        assert call.request.headers["content-type"] == "application/json"
+    client.close()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_codec_roundtrip(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    codec = importlib.reload(json_codec)
+    try:
+        payload = {"jsonrpc": "2.0", "id": 1, "params": {"q": "héllo"}}
+        assert json.loads(codec.json_dumps(payload)) == payload
+        assert codec.json_loads(codec.json_dumps(payload)) == payload
+        assert json.loads(codec.json_dumps({1: "a"})) == {"1": "a"}
+        assert json.loads(codec.json_dumps({"n": 2**70})) == {"n": 2**70}
+        assert codec.json_dumps({"x": None}) == b'{"x":null}'
+        for bad in (float("nan"), float("inf"), -float("inf")):
+            with pytest.raises(ValueError):
+                codec.json_dumps({"x": [bad]})
+        assert math.isnan(codec.json_loads('{"score": NaN}')["score"])
+        with pytest.raises(ValueError):
+            codec.json_loads("{not json")
+    finally:
+        monkeypatch.undo()
+        importlib.reload(json_codec)
+
+
 # ---- status-code-to-exception mapping ----
 
 
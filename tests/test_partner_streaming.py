@@ -3,12 +3,14 @@ resource-backed conversation reads + user_details_read. Unit (mocked) only."""
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 import httpx
 import pytest
 import respx
 
+from superme_sdk import APIError, astream_to_string, stream_to_string
 from superme_sdk.client import AsyncSuperMeClient, SuperMeClient
 
 MCP_BASE = "https://mcp.superme.ai"
@@ -142,6 +144,57 @@ class TestAskStream:
         assert body["conversation_id"] == "c1"
 
 
+# ---------------------------------------------------------------------------
+# stream_to_string helpers
+# ---------------------------------------------------------------------------
+
+
+class TestStreamToString:
+    @respx.mock
+    def test_concatenates_content_chunks(self):
+        respx.post(f"{PARTNER_BASE}/partner/ask").mock(
+            return_value=httpx.Response(
+                200,
+                content=_sse(
+                    {"type": "content", "text": "PMF "},
+                    {"type": "tool", "label": "Searching"},
+                    {"type": "content", "text": "is retention."},
+                    {"type": "done", "conversation_id": "c1"},
+                ),
+                headers={"content-type": "text/event-stream"},
+            )
+        )
+        with SuperMeClient(api_key=FAKE_JWT) as client:
+            text = stream_to_string(client.ask("q", username="ludo", stream=True))
+        assert text == "PMF is retention."
+
+    def test_error_chunk_raises(self):
+        chunks = [
+            {"type": "content", "text": "par"},
+            {"type": "error", "message": "agent failed"},
+        ]
+        with pytest.raises(APIError, match="agent failed"):
+            stream_to_string(chunks)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_concatenates_content_chunks(self):
+        respx.post(f"{PARTNER_BASE}/partner/ask").mock(
+            return_value=httpx.Response(
+                200,
+                content=_sse(
+                    {"type": "content", "text": "hel"},
+                    {"type": "content", "text": "lo"},
+                    {"type": "done", "conversation_id": "c1"},
+                ),
+                headers={"content-type": "text/event-stream"},
+            )
+        )
+        async with AsyncSuperMeClient(api_key=FAKE_JWT) as client:
+            text = await astream_to_string(client.ask("q", stream=True))
+        assert text == "hello"
+
+
 # ---------------------------------------------------------------------------
 # async streaming
 # ---------------------------------------------------------------------------
@@ -180,6 +233,20 @@ class TestAsyncStreaming:
         assert body["identifier"] == "ludo"
         assert answer == "PMF is retention."
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_ask_gather_preserves_order(self):
+        def _answer(request):
+            who = json.loads(request.content)["identifier"]
+            return httpx.Response(200, json={"answer": f"from {who}"})
+
+        respx.post(f"{PARTNER_BASE}/partner/ask").mock(side_effect=_answer)
+        async with AsyncSuperMeClient(api_key=FAKE_JWT) as client:
+            answers = await asyncio.gather(
+                *[client.ask("q", username=u) for u in ["ludo", "casey"]]
+            )
+        assert answers == ["from ludo", "from casey"]
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_async_get_user_details(self):